@@ -6,3 +6,11 @@ DB_SCHEMA = "nyc_taxi_dw"
 DB_USER = "admin"
 DB_PASSWORD = "password"
 DB_PORT = 5439
+
+# Backend de carga das tabelas volumosas (time_dim e trips_fact):
+#   "psycopg2" - INSERT em lote com execute_values (padrão)
+#   "asyncpg"  - COPY binário assíncrono, sobrepondo a leitura do próximo lote
+#                do Parquet com o envio do lote atual
+DB_BACKEND = "psycopg2"
+DB_COPY_BATCH_SIZE = 100_000  # Linhas por lote lido do Parquet (asyncpg)
+DB_MAX_IN_FLIGHT = 4  # Lotes decodificados aguardando envio (asyncpg)
@@ -1,12 +1,13 @@
+import argparse
 import json
+import os
+from datetime import datetime
 
 import config.database_config as db_config
-from modules.database import create_tables, persist_data, start_connection
-from modules.ingest import ingest_data
-from modules.process import process_yellow_tripdata, process_zone_lookup
-from modules.transform import (create_location_dim, create_payment_type_dim,
-                               create_rate_code_dim, create_time_dim,
-                               create_trips_fact, create_vendor_dim)
+
+# Os módulos de modules.* (pandas, psycopg2, pendulum, requests) são
+# importados apenas dentro da etapa que precisa deles, para que comandos
+# leves como `status` iniciem rapidamente.
 
 DB_NAME = db_config.DB_NAME
 
@@ -20,6 +21,18 @@ PARQUET_FILES = {
     "trips_fact": "data/warehouse/trips_fact.parquet",
 }
 
+# Arquivos acompanhados pelo comando status, por etapa
+STAGE_FILES = {
+    "raw": ["data/raw/yellow_tripdata.parquet",
+            "data/raw/taxi_zone_lookup.csv"],
+    "staging": ["data/staging/yellow_tripdata.parquet",
+                "data/staging/zone_lookup.parquet"],
+    "rejects": ["data/rejects/yellow_tripdata_rejects.parquet"],
+    "warehouse": list(PARQUET_FILES.values()),
+}
+
+REJECTS_SUMMARY = "data/rejects/yellow_tripdata_summary.json"
+
 
 def get_schema():
     # Carregar o schema de um arquivo JSON
@@ -28,38 +41,138 @@ def get_schema():
         return schema
 
 
-print("Iniciando o pipeline...")
-
-# Ingestão de Dados
-print("\n\nEtapa 1: Ingestão dos Dados")
-ingest_data()
-
-
-# Processar os DataFrames
-print("\n\nEtapa 2: Processamento dos Dados")
-# zone_shapefile = process_zone_shapefile()
-zone_lookup = process_zone_lookup()
-yellow_dataframes = process_yellow_tripdata()
-
+def run_ingest(args):
+    """Etapa 1: baixa os dados brutos para data/raw."""
+    from modules.ingest import ingest_data
 
-# Processar os DataFrames
-print("\n\nEtapa 3: Modelagem Dimensional")
+    print("\n\nEtapa 1: Ingestão dos Dados")
+    ingest_data()
 
-table_time_dim = create_time_dim(yellow_dataframes, get_schema())
-table_location_dim = create_location_dim(zone_lookup, get_schema())
-table_vendor_dim = create_vendor_dim(get_schema())
-table_rate_code_dim = create_rate_code_dim(get_schema())
-table_payment_type_dim = create_payment_type_dim(get_schema())
-table_trips_fact = create_trips_fact(
-    yellow_dataframes, table_time_dim, table_location_dim, table_vendor_dim,
-    table_rate_code_dim, table_payment_type_dim, get_schema())
 
-# Persistir os dados no banco
-print("\n\nEtapa 4: Persistência dos Dados\n")
+def run_process(args):
+    """
+    Etapa 2: processa os dados brutos para data/staging.
 
-# Criação do banco de dados
-start_connection(DB_NAME)
+    Retorna:
+        tuple: DataFrames zone_lookup e yellow_tripdata processados.
+    """
+    from modules.process import process_yellow_tripdata, process_zone_lookup
 
-# Criar as tabelas no banco de dados
-create_tables()
-persist_data(PARQUET_FILES)
+    print("\n\nEtapa 2: Processamento dos Dados")
+    # zone_shapefile = process_zone_shapefile()
+    zone_lookup = process_zone_lookup()
+    yellow_dataframes = process_yellow_tripdata()
+
+    return zone_lookup, yellow_dataframes
+
+
+def run_transform(args, zone_lookup=None, yellow_dataframes=None):
+    """
+    Etapa 3: cria as tabelas do modelo dimensional em data/warehouse. Quando \
+    executada isoladamente, lê os DataFrames processados de data/staging.
+    """
+    import pandas as pd
+
+    from modules.transform import (STAGING_DIR, create_location_dim,
+                                   create_payment_type_dim,
+                                   create_rate_code_dim, create_time_dim,
+                                   create_trips_fact, create_vendor_dim)
+
+    if zone_lookup is None:
+        zone_lookup = pd.read_parquet(f"{STAGING_DIR}/zone_lookup.parquet")
+    if yellow_dataframes is None:
+        yellow_dataframes = pd.read_parquet(
+            f"{STAGING_DIR}/yellow_tripdata.parquet")
+
+    print("\n\nEtapa 3: Modelagem Dimensional")
+    schema = get_schema()
+
+    table_time_dim = create_time_dim(yellow_dataframes, schema)
+    table_location_dim = create_location_dim(zone_lookup, schema)
+    table_vendor_dim = create_vendor_dim(schema)
+    table_rate_code_dim = create_rate_code_dim(schema)
+    table_payment_type_dim = create_payment_type_dim(schema)
+    create_trips_fact(
+        yellow_dataframes, table_time_dim, table_location_dim,
+        table_vendor_dim, table_rate_code_dim, table_payment_type_dim, schema)
+
+
+def run_load(args):
+    """Etapa 4: persiste as tabelas de data/warehouse no banco."""
+    from modules.database import create_tables, persist_data, start_connection
+
+    print("\n\nEtapa 4: Persistência dos Dados\n")
+
+    # Criação do banco de dados
+    start_connection(DB_NAME)
+
+    # Criar as tabelas no banco de dados
+    create_tables()
+    persist_data(PARQUET_FILES, backend=getattr(args, "backend", None))
+
+
+def run_status(args):
+    """Mostra os arquivos gerados por cada etapa e o resumo da validação."""
+    from modules.fingerprint import read_manifest
+
+    for stage, paths in STAGE_FILES.items():
+        print(f"\n[{stage}]")
+        for path in paths:
+            if os.path.exists(path):
+                modified = datetime.fromtimestamp(os.path.getmtime(path))
+                size_mb = os.path.getsize(path) / (1024 * 1024)
+                print(f"\t{path}: {size_mb:.2f} MB, atualizado em \
+{modified:%d/%m/%Y %H:%M:%S}")
+            else:
+                print(f"\t{path}: ausente")
+
+    if os.path.exists(REJECTS_SUMMARY):
+        with open(REJECTS_SUMMARY, "r") as file:
+            summary = json.load(file)
+        print(f"\n[validação]\n\t{summary['rejected_rows']} de \
+{summary['total_rows']} linhas rejeitadas")
+
+    manifest = read_manifest()
+    if manifest:
+        print("\n[impressões digitais das dimensões]")
+        for table_name, fingerprint in manifest.items():
+            print(f"\t{table_name}: {fingerprint[:12]}")
+
+
+def run_all(args):
+    """Executa o pipeline completo, repassando os DataFrames em memória."""
+    print("Iniciando o pipeline...")
+    run_ingest(args)
+    zone_lookup, yellow_dataframes = run_process(args)
+    run_transform(args, zone_lookup, yellow_dataframes)
+    run_load(args)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Pipeline NYC Yellow Taxi Trip Records. Sem subcomando, \
+executa todas as etapas.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    for name, func, help_text in [
+        ("ingest", run_ingest, "baixa os dados brutos para data/raw"),
+        ("process", run_process, "processa os dados para data/staging"),
+        ("transform", run_transform,
+         "cria o modelo dimensional em data/warehouse"),
+        ("load", run_load, "persiste data/warehouse no banco"),
+        ("status", run_status, "mostra o estado dos arquivos do pipeline"),
+    ]:
+        subparser = subparsers.add_parser(name, help=help_text)
+        subparser.set_defaults(func=func)
+        if name == "load":
+            subparser.add_argument(
+                "--backend", choices=["psycopg2", "asyncpg"],
+                help="sobrescreve DB_BACKEND de config/database_config.py")
+
+    args = parser.parse_args(argv)
+    func = getattr(args, "func", run_all)
+    func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,29 @@
+import re
+import time
+
 import pandas as pd
 import psycopg2
 from psycopg2.extras import execute_values
 
 import config.database_config as db_config
+from modules.fingerprint import fingerprint_data, fingerprint_file
+
+SCHEMA_FILE = "sql/schema.sql"
+
+# Dimensões mantidas entre execuções e suas chaves naturais
+DIMENSION_KEYS = {
+    "vendor_dim": "vendor_id",
+    "location_dim": "location_id",
+    "rate_code_dim": "rate_code_id",
+    "payment_type_dim": "payment_type_id",
+}
 
 
 def start_connection(db_name):
     """Estabelece conexão inicial ao banco padrão para criar o banco especifico
-do projeto desejado."""
+do projeto desejado, caso ainda não exista. O banco é preservado entre as
+execuções para que as dimensões sem alterações não precisem ser recarregadas.
+"""
     conn = psycopg2.connect(dbname='postgres', user=db_config.DB_USER,
                             password=db_config.DB_PASSWORD,
                             host=db_config.DB_HOST, port=db_config.DB_PORT)
@@ -15,13 +31,14 @@ do projeto desejado."""
     cursor = conn.cursor()
 
     try:
-        # Remove o banco existente, se houver
-        cursor.execute(f"DROP DATABASE IF EXISTS {db_name};")
-        print(f"Banco de dados '{db_name}' removido com sucesso.")
-
-        # Cria o banco de dados
-        cursor.execute(f"CREATE DATABASE {db_name};")
-        print(f"Banco de dados '{db_name}' criado com sucesso.")
+        cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s;",
+                       (db_name,))
+        if cursor.fetchone():
+            print(f"Banco de dados '{db_name}' já existe.")
+        else:
+            # Cria o banco de dados
+            cursor.execute(f"CREATE DATABASE {db_name};")
+            print(f"Banco de dados '{db_name}' criado com sucesso.")
 
     finally:
         cursor.close()
@@ -49,9 +66,71 @@ def get_connection():
         raise
 
 
-def create_tables(schema_file="sql/schema.sql"):
+def get_table_ddl(table_name, schema_file=SCHEMA_FILE):
+    """
+    Extrai do arquivo de esquema SQL o comando CREATE TABLE de uma tabela.
+
+    Args:
+        table_name (str): Nome da tabela.
+        schema_file (str): Caminho para o arquivo de esquema SQL.
+
+    Retorna:
+        str: Comando CREATE TABLE da tabela.
+    """
+
+    with open(schema_file, "r") as f:
+        schema_sql = f.read()
+
+    match = re.search(
+        rf"CREATE TABLE IF NOT EXISTS {table_name} \(.*?\);", schema_sql,
+        re.DOTALL)
+    if not match:
+        raise ValueError(
+            f"Tabela {table_name} não encontrada em {schema_file}")
+
+    return match.group(0)
+
+
+def drop_changed_dimensions(cursor, schema_file=SCHEMA_FILE):
+    """
+    Remove as dimensões cuja definição (DDL) em schema.sql difere da \
+registrada em load_control na última carga, para que sejam recriadas com a \
+nova definição e recarregadas por completo. Dimensões sem registro de DDL \
+também são removidas, pois sua definição no banco é desconhecida.
+
+    Args:
+        cursor: Cursor da conexão com o banco de dados.
+        schema_file (str): Caminho para o arquivo de esquema SQL.
+    """
+
+    cursor.execute("SELECT to_regclass(%s);",
+                   (f"{db_config.DB_SCHEMA}.load_control",))
+    loaded = {}
+    if cursor.fetchone()[0]:
+        cursor.execute(f"""SELECT table_name, ddl_fingerprint FROM {
+db_config.DB_SCHEMA}.load_control""")
+        loaded = dict(cursor.fetchall())
+
+    for table_name in DIMENSION_KEYS:
+        ddl_fingerprint = fingerprint_data(
+            get_table_ddl(table_name, schema_file))
+        if loaded.get(table_name) == ddl_fingerprint:
+            continue
+
+        cursor.execute(f"""DROP TABLE IF EXISTS {
+db_config.DB_SCHEMA}.{table_name} CASCADE;""")
+        if table_name in loaded:
+            cursor.execute(f"""DELETE FROM {
+db_config.DB_SCHEMA}.load_control WHERE table_name = %s""", (table_name,))
+            print(f"Definição da tabela {table_name} alterada, a tabela \
+será recriada.")
+
+
+def create_tables(schema_file=SCHEMA_FILE):
     """
     Lê e executa o arquivo de esquema SQL para criar tabelas no banco de dados.
+    As dimensões com definição alterada são removidas antes (ver \
+drop_changed_dimensions).
 
     Args:
         schema_file (str): Caminho para o arquivo de esquema SQL.
@@ -64,6 +143,9 @@ def create_tables(schema_file="sql/schema.sql"):
         with open(schema_file, "r") as f:
             schema_sql = f.read()
 
+        # Remover as dimensões cuja definição mudou desde a última carga
+        drop_changed_dimensions(cursor, schema_file)
+
         # Executar os comandos SQL
         cursor.execute(schema_sql)
         connection.commit()
@@ -102,29 +184,149 @@ db_config.DB_SCHEMA}.{table_name}({columns}) VALUES %s"""
     print(f"Dados inseridos na tabela {table_name}")
 
 
-def persist_data(parquet_files):
+def get_loaded_fingerprint(table_name, connection):
+    """
+    Obtém a impressão digital do último arquivo carregado na tabela.
+
+    Args:
+        table_name (str): Nome da tabela no banco de dados.
+        connection: Objeto de conexão com o banco de dados.
+
+    Retorna:
+        str | None: Impressão digital registrada em load_control.
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"""SELECT fingerprint FROM {
+db_config.DB_SCHEMA}.load_control WHERE table_name = %s""", (table_name,))
+        row = cursor.fetchone()
+
+    return row[0] if row else None
+
+
+def sync_dimension(df, table_name, key, fingerprint, ddl_fingerprint,
+                   connection):
+    """
+    Sincroniza uma dimensão com o banco aplicando apenas a diferença (SCD \
+tipo 1): linhas novas ou alteradas são inseridas/atualizadas e linhas que \
+deixaram de existir na fonte são removidas.
+
+    Args:
+        df (pd.DataFrame): DataFrame com o conteúdo atual da dimensão.
+        table_name (str): Nome da tabela no banco de dados.
+        key (str): Coluna chave natural da dimensão.
+        fingerprint (str): Impressão digital do arquivo carregado.
+        ddl_fingerprint (str): Impressão digital da definição da tabela.
+        connection: Objeto de conexão com o banco de dados.
+    """
+
+    columns = list(df.columns)
+    key_index = columns.index(key)
+    table = f"{db_config.DB_SCHEMA}.{table_name}"
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {','.join(columns)} FROM {table}")
+        current = {row[key_index]: tuple(row)
+                   for row in cursor.fetchall()}
+
+        rows = [tuple(row[1:]) for row in df.itertuples()]
+        source_keys = {row[key_index] for row in rows}
+        upserts = [row for row in rows
+                   if current.get(row[key_index]) != row]
+        deletes = [k for k in current if k not in source_keys]
+
+        if upserts:
+            updates = ",".join(f"{col} = EXCLUDED.{col}"
+                               for col in columns if col != key)
+            execute_values(cursor, f"""INSERT INTO {table}({
+','.join(columns)}) VALUES %s ON CONFLICT ({key}) DO UPDATE SET {updates}""",
+                           upserts)
+
+        if deletes:
+            cursor.execute(f"DELETE FROM {table} WHERE {key} = ANY(%s)",
+                           (deletes,))
+
+        cursor.execute(f"""INSERT INTO {db_config.DB_SCHEMA}.load_control(
+table_name, fingerprint, ddl_fingerprint) VALUES (%s, %s, %s)
+ON CONFLICT (table_name) DO UPDATE SET fingerprint = EXCLUDED.fingerprint,
+ddl_fingerprint = EXCLUDED.ddl_fingerprint, loaded_at = NOW()""",
+                       (table_name, fingerprint, ddl_fingerprint))
+    connection.commit()
+
+    print(f"Tabela {table_name} sincronizada: {len(upserts)} linhas \
+inseridas/atualizadas, {len(deletes)} removidas")
+
+
+def persist_data(parquet_files, backend=None):
     """
     Persiste múltiplos DataFrames em suas respectivas tabelas no banco de \
-dados.
+dados. As dimensões em DIMENSION_KEYS só são sincronizadas quando o arquivo \
+parquet mudou desde a última carga. As demais tabelas são carregadas pelo \
+backend configurado em DB_BACKEND (psycopg2 ou asyncpg).
 
     Args:
         parquet_files (dict): Dicionário contendo os caminhos para os arquivos\
  parquet em finaliados em warehouse e seus nomes de tabela correspondentes.
+        backend (str): Sobrescreve db_config.DB_BACKEND, se informado.
     """
 
+    backend = backend or db_config.DB_BACKEND
+    if backend not in ("psycopg2", "asyncpg"):
+        raise ValueError(f"Backend de carga não suportado: {backend}")
+
+    # Tabelas carregadas via asyncpg após a sincronização das dimensões
+    async_files = {}
+    start = time.perf_counter()
+
     # Conexão com o banco de dados
     connection = get_connection()
 
     # Iterar sobre cada tabela e popular com dados do Parquet
     try:
         for table_name, parquet_path in parquet_files.items():
+            if table_name in DIMENSION_KEYS:
+                fingerprint = fingerprint_file(parquet_path)
+                if get_loaded_fingerprint(
+                        table_name, connection) == fingerprint:
+                    print(f"\nTabela {table_name} sem alterações, carga \
+ignorada.")
+                    continue
+
+                print(f"\nLendo dados de {parquet_path} para \
+sincronizar {table_name}...")
+                df = pd.read_parquet(parquet_path)
+                sync_dimension(df, table_name, DIMENSION_KEYS[table_name],
+                               fingerprint, fingerprint_data(
+                                   get_table_ddl(table_name)),
+                               connection)
+                continue
+
+            if backend == "asyncpg":
+                async_files[table_name] = parquet_path
+                continue
+
             print(f"\nLendo dados de {parquet_path} para \
 popular {table_name}...")
+            table_start = time.perf_counter()
             df = pd.read_parquet(parquet_path)
             insert_data(df, table_name, connection)
+            print(f"Tabela {table_name} carregada em \
+{time.perf_counter() - table_start:.2f}s")
+
+        if async_files:
+            # Importado apenas quando o backend asyncpg é selecionado
+            from modules.database_async import copy_tables
 
-    except psycopg2.Error as e:
+            copy_tables(async_files)
+
+        print(f"\nPersistência concluída ({backend}) em \
+{time.perf_counter() - start:.2f}s")
+
+    except Exception as e:
+        # Mesmo tratamento para os dois backends (psycopg2.Error,
+        # asyncpg.PostgresError, OSError de conexão etc.)
         print("\n\nErro ao conectar ou inserir dados no PostgreSQL:", e)
+        raise
 
     finally:
         if connection:
@@ -0,0 +1,134 @@
+import asyncio
+import contextlib
+import time
+
+import asyncpg
+import pyarrow.parquet as pq
+
+import config.database_config as db_config
+
+
+def next_records(batches):
+    """
+    Decodifica o próximo lote do arquivo Parquet em registros (tuplas) \
+prontos para o COPY binário.
+
+    Args:
+        batches: Iterador de pyarrow.RecordBatch.
+
+    Retorna:
+        list | None: Registros do lote ou None ao fim do arquivo.
+    """
+
+    batch = next(batches, None)
+    if batch is None:
+        return None
+
+    return list(zip(*(column.to_pylist() for column in batch.columns)))
+
+
+async def produce_batches(parquet_file, queue, batch_size):
+    """
+    Lê o arquivo Parquet em lotes, em uma thread separada, e os coloca na \
+fila. Como a fila é limitada, a leitura aguarda quando há lotes demais \
+pendentes de envio (backpressure). Ao final é enviado None.
+
+    Args:
+        parquet_file (pq.ParquetFile): Arquivo Parquet de origem.
+        queue (asyncio.Queue): Fila limitada de lotes a enviar.
+        batch_size (int): Número de linhas por lote.
+    """
+
+    batches = parquet_file.iter_batches(batch_size=batch_size)
+    try:
+        while True:
+            records = await asyncio.to_thread(next_records, batches)
+            await queue.put(records)
+            if records is None:
+                break
+    except Exception:
+        # Libera o consumidor para que o erro de leitura seja propagado
+        await queue.put(None)
+        raise
+
+
+async def copy_table(connection, table_name, parquet_path):
+    """
+    Copia um arquivo Parquet para a tabela via COPY binário do asyncpg. A \
+decodificação do próximo lote ocorre enquanto o lote atual é enviado ao \
+banco.
+
+    Args:
+        connection (asyncpg.Connection): Conexão com o banco de dados.
+        table_name (str): Nome da tabela no banco de dados.
+        parquet_path (str): Caminho do arquivo Parquet.
+
+    Retorna:
+        int: Número de linhas copiadas.
+    """
+
+    parquet_file = pq.ParquetFile(parquet_path)
+    columns = parquet_file.schema_arrow.names
+    queue = asyncio.Queue(maxsize=db_config.DB_MAX_IN_FLIGHT)
+
+    producer = asyncio.create_task(
+        produce_batches(parquet_file, queue, db_config.DB_COPY_BATCH_SIZE))
+
+    total = 0
+    try:
+        async with connection.transaction():
+            while (records := await queue.get()) is not None:
+                await connection.copy_records_to_table(
+                    table_name, records=records, columns=columns,
+                    schema_name=db_config.DB_SCHEMA)
+                total += len(records)
+
+            # Propaga erros de leitura do arquivo antes de confirmar a carga
+            await producer
+    except BaseException:
+        producer.cancel()
+        # Aguarda o encerramento do produtor; o erro original é o propagado
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await producer
+        raise
+
+    return total
+
+
+async def copy_tables_async(parquet_files):
+    """
+    Copia múltiplos arquivos Parquet, na ordem informada, para suas tabelas.
+
+    Args:
+        parquet_files (dict): Nome da tabela -> caminho do arquivo Parquet.
+    """
+
+    connection = await asyncpg.connect(
+        host=db_config.DB_HOST,
+        database=db_config.DB_NAME,
+        user=db_config.DB_USER,
+        password=db_config.DB_PASSWORD,
+        port=db_config.DB_PORT
+    )
+
+    try:
+        for table_name, parquet_path in parquet_files.items():
+            print(f"\nCopiando dados de {parquet_path} para \
+{table_name} (asyncpg)...")
+            start = time.perf_counter()
+            total = await copy_table(connection, table_name, parquet_path)
+            print(f"Dados inseridos na tabela {table_name}: {total} linhas \
+em {time.perf_counter() - start:.2f}s")
+    finally:
+        await connection.close()
+
+
+def copy_tables(parquet_files):
+    """
+    Ponto de entrada síncrono para a carga assíncrona com asyncpg.
+
+    Args:
+        parquet_files (dict): Nome da tabela -> caminho do arquivo Parquet.
+    """
+
+    asyncio.run(copy_tables_async(parquet_files))
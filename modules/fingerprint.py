@@ -0,0 +1,70 @@
+import hashlib
+import json
+import os
+
+MANIFEST_PATH = "data/warehouse/fingerprints.json"
+
+
+def fingerprint_data(data):
+    """
+    Calcula a impressão digital (sha256) de uma estrutura serializável em \
+    JSON, como as listas estáticas das dimensões.
+
+    Args:
+        data: Estrutura (listas, dicionários, tuplas) a ser identificada.
+
+    Retorna:
+        str: Hash hexadecimal do conteúdo.
+    """
+
+    content = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def fingerprint_file(path, chunk_size=1024 * 1024):
+    """
+    Calcula a impressão digital (sha256) do conteúdo de um arquivo.
+
+    Args:
+        path (str): Caminho do arquivo.
+        chunk_size (int): Tamanho dos blocos lidos do disco.
+
+    Retorna:
+        str: Hash hexadecimal do conteúdo.
+    """
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_manifest(manifest_path=MANIFEST_PATH):
+    """
+    Lê o manifesto com as impressões digitais das fontes das tabelas \
+    geradas em data/warehouse.
+
+    Retorna:
+        dict: Nome da tabela -> impressão digital da fonte.
+    """
+
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, "r") as file:
+        return json.load(file)
+
+
+def update_manifest(table_name, fingerprint, manifest_path=MANIFEST_PATH):
+    """
+    Registra a impressão digital da fonte de uma tabela no manifesto.
+
+    Args:
+        table_name (str): Nome da tabela.
+        fingerprint (str): Impressão digital da fonte.
+    """
+
+    manifest = read_manifest(manifest_path)
+    manifest[table_name] = fingerprint
+    with open(manifest_path, "w") as file:
+        json.dump(manifest, file, indent=4, sort_keys=True)
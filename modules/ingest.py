@@ -2,8 +2,6 @@ import io
 import os
 from zipfile import ZipFile
 
-import requests
-
 RAW_DIR = "data/raw"
 
 DATA_URLS = {
@@ -39,6 +37,9 @@ def download_file(url, output_path):
     """
 
     if not os.path.exists(output_path):
+        # Importado apenas quando há download, para não atrasar o início
+        import requests
+
         print(f"\nBaixando - {output_path}\n{url}...\n")
         response = requests.get(url)
         if '.zip' in url:
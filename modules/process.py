@@ -5,7 +5,9 @@ import pandas as pd
 import pendulum
 from dateutil.relativedelta import relativedelta
 
-DATETIME = pendulum.now("America/Sao_Paulo")
+from modules.validate import get_rules, validate
+
+TIMEZONE = "America/Sao_Paulo"
 RAW_DIR = "data/raw"
 STAGING_DIR = "data/staging"
 
@@ -68,26 +70,33 @@ def date_range(df: pd.DataFrame, columns_list: list):
     return last_day_previous_month, first_day_next_month
 
 
-def apply_filter(df, last_day_previous_month, first_day_next_month):
+def period_rules(last_day_previous_month, first_day_next_month):
     """
-    Filtra o dataframe de acordo com o intervalo especificado em:
+    Cria as regras de validação do intervalo especificado em:
         last_day_previous_month, first_day_next_month.
 
     Retorna:
-        pd.Dataframe: DataFrames filtrado para as datas selecionadas.
+        list: Regras de validação para pickup_datetime e dropoff_datetime.
     """
-    # Aplicando o filtro de data
-    date_filter = (
-        (df['pickup_datetime'] >= last_day_previous_month) &
-        (df['pickup_datetime'] < first_day_next_month) &
-        (df['dropoff_datetime'] > last_day_previous_month + relativedelta(
-            days=1)) &
-        (df['dropoff_datetime'] <= first_day_next_month)
-    )
-
-    filtered_df = df[date_filter]
 
-    return filtered_df
+    return [
+        {
+            "code": "pickup_datetime_out_of_period",
+            "type": "range",
+            "column": "pickup_datetime",
+            "min": last_day_previous_month,
+            "max": first_day_next_month,
+            "max_inclusive": False
+        },
+        {
+            "code": "dropoff_datetime_out_of_period",
+            "type": "range",
+            "column": "dropoff_datetime",
+            "min": last_day_previous_month + relativedelta(days=1),
+            "min_inclusive": False,
+            "max": first_day_next_month
+        }
+    ]
 
 
 def process_yellow_tripdata():
@@ -119,19 +128,21 @@ def process_yellow_tripdata():
     last_day_previous_month, first_day_next_month = date_range(
         df=df, columns_list=['pickup_datetime', 'dropoff_datetime'])
 
-    # Aplicando o filtro no DataFrame
-    df = df.query("fare_amount > 0")
-    df = df.query("passenger_count > 0")
-    df = apply_filter(df, last_day_previous_month, first_day_next_month)
-
     # Substiuir os valores invalidos pelos valores dominantes nos dados
     df['rate_code_id'] = df['rate_code_id'].fillna(1)
     df['rate_code_id'] = df['rate_code_id'].replace(99, 1)
-    df['passenger_count'] = df['passenger_count'].fillna(1)
     df['store_and_fwd_flag'] = df['store_and_fwd_flag'].fillna('N')
     df['vendor_id'] = df['vendor_id'].replace(6, 2)
     df['payment_type_id'] = df['payment_type_id'].replace(0, 5)
-    df['load_datetime'] = DATETIME.format('DD/MM/YYYY HH:mm:ss')
+
+    # Aplicando as regras de validação (rejeitados vão para data/rejects)
+    rules = get_rules("yellow_tripdata") + period_rules(
+        last_day_previous_month, first_day_next_month)
+    df = validate(df, rules, "yellow_tripdata")
+
+    # Horário de carga calculado na execução da etapa (e não na importação)
+    load_datetime = pendulum.now(TIMEZONE)
+    df['load_datetime'] = load_datetime.format('DD/MM/YYYY HH:mm:ss')
 
     df.to_parquet(f"{STAGING_DIR}/yellow_tripdata.parquet", index=False)
     print(f"Arquivo processado em staging: \
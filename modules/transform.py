@@ -1,8 +1,90 @@
+import os
+
 import pandas as pd
 
+from modules.fingerprint import (fingerprint_data, fingerprint_file,
+                                 read_manifest, update_manifest)
+
+RAW_DIR = "data/raw"
 STAGING_DIR = "data/staging"
 WAREHOUSE_DIR = "data/warehouse"
 
+# Conteúdo das dimensões estáticas. Também define o domínio das regras de
+# validação que referenciam essas dimensões (ver get_dimension_keys).
+VENDOR_DIM = [
+    (1, "Creative Mobile Technologies, LLC"),
+    (2, "VeriFone Inc")
+]
+
+RATE_CODE_DIM = [
+    (1, "Standard rate"),
+    (2, "JFK"),
+    (3, "Newark"),
+    (4, "Nassau or Westchester"),
+    (5, "Negotiated fare"),
+    (6, "Group ride")
+]
+
+PAYMENT_TYPE_DIM = [
+    (1, "Credit Card"),
+    (2, "Cash"),
+    (3, "No Charge"),
+    (4, "Dispute"),
+    (5, "Unknown"),
+    (6, "Voided Trip")
+]
+
+STATIC_DIMENSIONS = {
+    'vendor_dim': VENDOR_DIM,
+    'rate_code_dim': RATE_CODE_DIM,
+    'payment_type_dim': PAYMENT_TYPE_DIM,
+}
+
+
+def get_dimension_keys(table_name):
+    """
+        Retorna as chaves naturais de uma dimensão a partir da mesma fonte \
+        usada para construí-la (listas estáticas ou taxi_zone_lookup.csv).
+
+    Args:
+        table_name: nome da tabela dimensão
+
+    Retorna:
+        list: Chaves naturais da dimensão.
+    """
+
+    if table_name == 'location_dim':
+        zone_lookup = pd.read_csv(f"{RAW_DIR}/taxi_zone_lookup.csv",
+                                  usecols=['LocationID'])
+        return zone_lookup['LocationID'].tolist()
+
+    return [key for key, _ in STATIC_DIMENSIONS[table_name]]
+
+
+def load_unchanged_dim(table_name, fingerprint):
+    """
+        Reaproveita o arquivo parquet da dimensão em data/warehouse quando a \
+        impressão digital da fonte não mudou desde a última geração.
+
+    Args:
+        table_name: nome da tabela dimensão
+        fingerprint: impressão digital atual da fonte da dimensão
+
+    Retorna:
+        pd.DataFrame | None: Dimensão já existente ou None se for preciso \
+        reconstruí-la.
+    """
+
+    parquet_path = f"{WAREHOUSE_DIR}/{table_name}.parquet"
+    if (read_manifest().get(table_name) != fingerprint or
+            not os.path.exists(parquet_path)):
+        return None
+
+    print(f"Tabela {table_name} sem alterações na fonte, reaproveitando: \
+{parquet_path}")
+
+    return pd.read_parquet(parquet_path)
+
 
 def create_time_dim(df, schema):
     """
@@ -62,10 +144,12 @@ def create_vendor_dim(schema):
         schema: arquivo json com os schemas dos arquivos parquet
     """
 
-    vendor_dim = [
-        (1, "Creative Mobile Technologies, LLC"),
-        (2, "VeriFone Inc")
-    ]
+    vendor_dim = VENDOR_DIM
+
+    fingerprint = fingerprint_data([vendor_dim, schema.get('vendor_dim')])
+    unchanged = load_unchanged_dim('vendor_dim', fingerprint)
+    if unchanged is not None:
+        return unchanged
 
     vendor_dim = pd.DataFrame(
         vendor_dim, columns=['vendor_id', 'vendor_name'])
@@ -74,6 +158,7 @@ def create_vendor_dim(schema):
     vendor_dim = vendor_dim.astype(schema.get('vendor_dim'))
 
     vendor_dim.to_parquet(f"{WAREHOUSE_DIR}/vendor_dim.parquet", index=False)
+    update_manifest('vendor_dim', fingerprint)
 
     print(f"Tabela vendor_dim processada em warehouse: \
 {WAREHOUSE_DIR}/vendor_dim.parquet")
@@ -91,6 +176,13 @@ def create_location_dim(df, schema):
         schema: arquivo json com os schemas dos arquivos parquet
     """
 
+    fingerprint = fingerprint_data([
+        fingerprint_file(f"{RAW_DIR}/taxi_zone_lookup.csv"),
+        schema.get('location_dim')])
+    unchanged = load_unchanged_dim('location_dim', fingerprint)
+    if unchanged is not None:
+        return unchanged
+
     # Combinar e obter timestamps únicos
     location_dim = df.drop_duplicates().reset_index(drop=True)
 
@@ -99,6 +191,7 @@ def create_location_dim(df, schema):
 
     location_dim.to_parquet(
         f"{WAREHOUSE_DIR}/location_dim.parquet", index=False)
+    update_manifest('location_dim', fingerprint)
 
     print(f"Tabela location_dim processada em warehouse: \
 {WAREHOUSE_DIR}/location_dim.parquet")
@@ -115,14 +208,13 @@ def create_rate_code_dim(schema):
         schema: arquivo json com os schemas dos arquivos parquet
     """
 
-    rate_code_dim = [
-        (1, "Standard rate"),
-        (2, "JFK"),
-        (3, "Newark"),
-        (4, "Nassau or Westchester"),
-        (5, "Negotiated fare"),
-        (6, "Group ride")
-    ]
+    rate_code_dim = RATE_CODE_DIM
+
+    fingerprint = fingerprint_data(
+        [rate_code_dim, schema.get('rate_code_dim')])
+    unchanged = load_unchanged_dim('rate_code_dim', fingerprint)
+    if unchanged is not None:
+        return unchanged
 
     rate_code_dim = pd.DataFrame(
         rate_code_dim, columns=['rate_code_id', 'rate_code_description'])
@@ -132,6 +224,7 @@ def create_rate_code_dim(schema):
 
     rate_code_dim.to_parquet(
         f"{WAREHOUSE_DIR}/rate_code_dim.parquet", index=False)
+    update_manifest('rate_code_dim', fingerprint)
 
     print(f"Tabela rate_code_dim processada em warehouse: \
 {WAREHOUSE_DIR}/rate_code_dim.parquet")
@@ -148,14 +241,13 @@ def create_payment_type_dim(schema):
         schema: arquivo json com os schemas dos arquivos parquet
     """
 
-    payment_type_dim = [
-        (1, "Credit Card"),
-        (2, "Cash"),
-        (3, "No Charge"),
-        (4, "Dispute"),
-        (5, "Unknown"),
-        (6, "Voided Trip")
-    ]
+    payment_type_dim = PAYMENT_TYPE_DIM
+
+    fingerprint = fingerprint_data(
+        [payment_type_dim, schema.get('payment_type_dim')])
+    unchanged = load_unchanged_dim('payment_type_dim', fingerprint)
+    if unchanged is not None:
+        return unchanged
 
     payment_type_dim = pd.DataFrame(
         payment_type_dim, columns=['payment_type_id', 'payment_description'])
@@ -165,6 +257,7 @@ def create_payment_type_dim(schema):
 
     payment_type_dim.to_parquet(
         f"{WAREHOUSE_DIR}/payment_type_dim.parquet", index=False)
+    update_manifest('payment_type_dim', fingerprint)
 
     print(f"Tabela payment_type_dim processada em warehouse: \
 {WAREHOUSE_DIR}/payment_type_dim.parquet")
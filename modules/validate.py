@@ -0,0 +1,216 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from modules.transform import get_dimension_keys
+
+REJECTS_DIR = "data/rejects"
+
+COMPARE_OPERATORS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+
+def get_rules(dataset):
+    """
+    Carrega as regras de validação do dataset expressas no arquivo JSON \
+    config/schema.json (chave "validation"). Regras enum que referenciam uma \
+    dimensão ("dimension") recebem como domínio as chaves da própria \
+    dimensão, para que validação e modelo dimensional não divirjam.
+
+    Args:
+        dataset (str): Nome do dataset (ex.: yellow_tripdata).
+
+    Retorna:
+        list: Lista de regras (dicionários) configuradas para o dataset.
+    """
+
+    with open("config/schema.json", "r") as file:
+        schema = json.load(file)
+        rules = schema.get("validation", {}).get(dataset, [])
+
+    for rule in rules:
+        if rule["type"] == "enum" and "dimension" in rule:
+            rule["values"] = get_dimension_keys(rule["dimension"])
+
+    return rules
+
+
+def _range_mask(df, rule):
+    """Marca os valores fora do intervalo [min, max] (nulos são ignorados)."""
+    values = df[rule["column"]].to_numpy()
+    present = ~pd.isna(values)
+    valid = present.copy()
+
+    def bound(limit):
+        # Limites datetime são convertidos para datetime64, evitando a
+        # comparação elemento a elemento com objetos Python
+        if values.dtype.kind == "M":
+            return pd.Timestamp(limit).to_datetime64()
+        return limit
+
+    with np.errstate(invalid="ignore"):
+        if "min" in rule:
+            if rule.get("min_inclusive", True):
+                valid &= values >= bound(rule["min"])
+            else:
+                valid &= values > bound(rule["min"])
+
+        if "max" in rule:
+            if rule.get("max_inclusive", True):
+                valid &= values <= bound(rule["max"])
+            else:
+                valid &= values < bound(rule["max"])
+
+    return present & ~valid
+
+
+def _not_null_mask(df, rule):
+    """Marca as linhas com valor nulo em qualquer uma das colunas."""
+    mask = np.zeros(len(df), dtype=bool)
+    for column in rule["columns"]:
+        mask |= pd.isna(df[column].to_numpy())
+    return mask
+
+
+def _enum_mask(df, rule):
+    """Marca os valores fora do domínio permitido (nulos são ignorados)."""
+    values = df[rule["column"]].to_numpy()
+    allowed = np.isin(values, np.asarray(rule["values"]))
+    return ~pd.isna(values) & ~allowed
+
+
+def _compare_mask(df, rule):
+    """Marca as linhas em que a comparação entre duas colunas é falsa."""
+    left = df[rule["left"]].to_numpy()
+    right = df[rule["right"]].to_numpy()
+    present = ~pd.isna(left) & ~pd.isna(right)
+    holds = COMPARE_OPERATORS[rule["op"]](left, right)
+    return present & ~holds
+
+
+def _sum_mask(df, rule):
+    """
+    Marca as linhas em que a coluna difere da soma dos componentes por mais \
+    que a tolerância configurada. Componentes ausentes contam como zero.
+    """
+    expected = np.zeros(len(df), dtype="float64")
+    for column in rule["components"]:
+        if column in df.columns:
+            values = df[column].to_numpy(dtype="float64")
+            np.add(expected, values, out=expected, where=~np.isnan(values))
+
+    total = df[rule["column"]].to_numpy(dtype="float64")
+    difference = np.abs(total - expected)
+    return ~np.isnan(total) & (difference > rule.get("tolerance", 0.01))
+
+
+RULE_TYPES = {
+    "range": _range_mask,
+    "not_null": _not_null_mask,
+    "enum": _enum_mask,
+    "compare": _compare_mask,
+    "sum": _sum_mask,
+}
+
+
+def evaluate_rules(df, rules):
+    """
+    Avalia todas as regras sobre o DataFrame em uma única passada vetorizada.
+
+    Args:
+        df (pd.DataFrame): DataFrame a ser validado.
+        rules (list): Regras de validação (ver config/schema.json).
+
+    Retorna:
+        np.ndarray: Matriz booleana (linhas x regras) com True onde a linha \
+        viola a regra.
+    """
+
+    # Ordem por colunas: cada regra preenche um bloco contíguo de memória
+    failures = np.zeros((len(df), len(rules)), dtype=bool, order="F")
+    for i, rule in enumerate(rules):
+        if rule["type"] not in RULE_TYPES:
+            raise ValueError(
+                f"Tipo de regra não suportado: {rule['type']} "
+                f"({rule['code']})")
+        failures[:, i] = RULE_TYPES[rule["type"]](df, rule)
+
+    return failures
+
+
+def _reject_reasons(failures, rules):
+    """
+    Monta os códigos das regras violadas por linha rejeitada. Os códigos são \
+    montados uma vez por combinação distinta de regras violadas e \
+    distribuídos como categorias.
+    """
+    if not len(failures):
+        return pd.Categorical([], categories=[])
+
+    packed = np.packbits(failures, axis=1)
+    keys = np.ascontiguousarray(packed).view(f"V{packed.shape[1]}").ravel()
+    _, first_rows, pattern_index = np.unique(
+        keys, return_index=True, return_inverse=True)
+    reasons = [";".join(rules[i]["code"] for i in np.flatnonzero(
+        failures[row])) for row in first_rows]
+
+    return pd.Categorical.from_codes(pattern_index.reshape(-1), reasons)
+
+
+def validate(df, rules, dataset):
+    """
+    Separa as linhas válidas das inválidas de acordo com as regras. As \
+    linhas rejeitadas são gravadas em data/rejects com os códigos das regras \
+    violadas (coluna reject_reasons) e o resumo das contagens por regra.
+
+    Args:
+        df (pd.DataFrame): DataFrame a ser validado.
+        rules (list): Regras de validação (ver config/schema.json).
+        dataset (str): Nome do dataset, usado para nomear os arquivos.
+
+    Retorna:
+        pd.DataFrame: DataFrame contendo apenas as linhas válidas.
+    """
+
+    failures = evaluate_rules(df, rules)
+    rejected = failures.any(axis=1)
+
+    summary = {
+        "dataset": dataset,
+        "total_rows": int(len(df)),
+        "rejected_rows": int(rejected.sum()),
+        "rules": {rule["code"]: int(count)
+                  for rule, count in zip(
+                      rules, np.count_nonzero(failures, axis=0))},
+    }
+
+    rejected_rows = np.flatnonzero(rejected)
+    rejects = df.take(rejected_rows)
+    rejects["reject_reasons"] = _reject_reasons(
+        failures[rejected_rows], rules)
+
+    os.makedirs(REJECTS_DIR, exist_ok=True)
+    rejects.to_parquet(f"{REJECTS_DIR}/{dataset}_rejects.parquet",
+                       index=False)
+    with open(f"{REJECTS_DIR}/{dataset}_summary.json", "w") as file:
+        json.dump(summary, file, indent=4)
+
+    print(f"Validação de {dataset}: {summary['rejected_rows']} de \
+{summary['total_rows']} linhas rejeitadas")
+    for code, count in summary["rules"].items():
+        if count:
+            print(f"\t{code}: {count}")
+    print(f"Linhas rejeitadas em: {REJECTS_DIR}/{dataset}_rejects.parquet")
+
+    if not rejected_rows.size:
+        return df
+
+    return df.take(np.flatnonzero(~rejected))
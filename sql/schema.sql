@@ -1,7 +1,18 @@
 -- Criar o esquema do banco (opcional)
-CREATE SCHEMA nyc_taxi_dw;
+CREATE SCHEMA IF NOT EXISTS nyc_taxi_dw;
 SET search_path TO nyc_taxi_dw;
 
+-- 0. Controle de carga das dimensões (impressão digital do último parquet
+-- carregado e da definição da tabela neste arquivo). As dimensões estáticas
+-- são mantidas entre execuções e só são sincronizadas quando o arquivo de
+-- origem muda; se a definição muda, a tabela é recriada.
+CREATE TABLE IF NOT EXISTS load_control (
+    table_name VARCHAR(100) PRIMARY KEY,
+    fingerprint VARCHAR(64) NOT NULL,
+    ddl_fingerprint VARCHAR(64) NOT NULL,
+    loaded_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
 -- 1. Dimensão de Tempo
 DROP TABLE IF EXISTS time_dim CASCADE;
 CREATE TABLE IF NOT EXISTS time_dim (
@@ -18,14 +29,12 @@ CREATE TABLE IF NOT EXISTS time_dim (
 );
 
 -- 2. Dimensão de Fornecedor
-DROP TABLE IF EXISTS vendor_dim CASCADE;
 CREATE TABLE IF NOT EXISTS vendor_dim (
     vendor_id INT PRIMARY KEY,
     vendor_name VARCHAR(255)
 );
 
 -- 3. Dimensão de Localização
-DROP TABLE IF EXISTS location_dim CASCADE;
 CREATE TABLE IF NOT EXISTS location_dim (
     location_id INT PRIMARY KEY,
     borough VARCHAR(100),
@@ -34,14 +43,12 @@ CREATE TABLE IF NOT EXISTS location_dim (
 );
 
 -- 4. Dimensão de Código de Tarifa
-DROP TABLE IF EXISTS rate_code_dim CASCADE;
 CREATE TABLE IF NOT EXISTS rate_code_dim (
     rate_code_id INT PRIMARY KEY,
     rate_code_description VARCHAR(255)
 );
 
 -- 5. Dimensão de Tipo de Pagamento
-DROP TABLE IF EXISTS payment_type_dim CASCADE;
 CREATE TABLE IF NOT EXISTS payment_type_dim (
     payment_type_id INT PRIMARY KEY,
     payment_description VARCHAR(255)